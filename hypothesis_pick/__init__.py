@@ -20,6 +20,7 @@ _CORE_EXPORTS = {
     "infer_implications",
     "find_equivalence_classes",
     "find_stronger_weaker",
+    "find_equivalence_and_ordering",
     "PredicateResult",
     "ImplicationResult",
 }
@@ -36,6 +37,7 @@ def __getattr__(name: str) -> Any:
             infer_implications,
             find_equivalence_classes,
             find_stronger_weaker,
+            find_equivalence_and_ordering,
             PredicateResult,
             ImplicationResult,
         )
@@ -52,6 +54,7 @@ def __getattr__(name: str) -> Any:
             "infer_implications": infer_implications,
             "find_equivalence_classes": find_equivalence_classes,
             "find_stronger_weaker": find_stronger_weaker,
+            "find_equivalence_and_ordering": find_equivalence_and_ordering,
             "PredicateResult": PredicateResult,
             "ImplicationResult": ImplicationResult,
         }
@@ -3,38 +3,54 @@ Core functionality for comparing boolean predicates using Hypothesis.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from itertools import combinations
 
-from hypothesis import given, settings, Verbosity, Phase
+from hypothesis import assume, given, settings, HealthCheck, Verbosity, Phase
 from hypothesis import strategies as st
 
 
 # Type aliases for clarity
 Predicate = Callable[..., bool]
 
+# Number of generated inputs buffered before predicates are evaluated as a batch
+_BATCH_SIZE = 512
+
 
 @dataclass
 class PredicateResult:
     """Result of predicate evaluation on an input."""
     
     input_value: Any
-    results: Dict[str, bool]
+    # Predicate outcomes as a bitmask: bit i is set iff names[i] is True
+    mask: int
+    # Predicate names, shared by every result from the same call
+    names: Tuple[str, ...]
+    
+    @property
+    def results(self) -> Tuple[bool, ...]:
+        """Predicate outcomes, in the same order as `names`."""
+        return tuple(bool(self.mask >> i & 1) for i in range(len(self.names)))
+    
+    def as_dict(self) -> Dict[str, bool]:
+        """Return the outcomes keyed by predicate name."""
+        return dict(zip(self.names, self.results))
     
     def disagreement_pairs(self) -> List[Tuple[str, str]]:
         """Return pairs of predicates that disagree on this input."""
         pairs = []
-        names = list(self.results.keys())
-        for i, name1 in enumerate(names):
-            for name2 in names[i + 1:]:
-                if self.results[name1] != self.results[name2]:
-                    pairs.append((name1, name2))
+        n = len(self.names)
+        all_true = (1 << n) - 1
+        for i in range(n):
+            # Predicates after i whose outcome differs from predicate i
+            differing = (self.mask ^ -(self.mask >> i & 1)) & all_true
+            for j in _iter_bits(differing >> (i + 1)):
+                pairs.append((self.names[i], self.names[i + 1 + j]))
         return pairs
     
     def has_disagreement(self) -> bool:
         """Check if any predicates disagree on this input."""
-        values = list(self.results.values())
-        return len(set(values)) > 1
+        return 0 < self.mask < (1 << len(self.names)) - 1
 
 
 @dataclass
@@ -73,18 +89,90 @@ def _get_predicate_name(pred: Predicate, index: int) -> str:
 
 
 def _evaluate_predicates(
-    predicates: Dict[str, Predicate],
+    predicates: Tuple[Predicate, ...],
     input_value: Any
-) -> PredicateResult:
-    """Evaluate all predicates on a given input."""
-    results = {}
-    for name, pred in predicates.items():
+) -> int:
+    """Evaluate all predicates on a given input.
+
+    Returns a bitmask: bit i is set iff predicates[i] is True on the input.
+    """
+    mask = 0
+    i = 0
+    n = len(predicates)
+    # One exception guard covers the whole loop; after a failure, evaluation
+    # resumes with the next predicate.
+    while i < n:
         try:
-            results[name] = bool(pred(input_value))
+            for i in range(i, n):
+                if predicates[i](input_value):
+                    mask |= 1 << i
+            break
         except Exception:
             # If a predicate raises an exception, treat as False
-            results[name] = False
-    return PredicateResult(input_value=input_value, results=results)
+            i += 1
+    return mask
+
+
+def _evaluate_predicates_batch(
+    predicates: List[Predicate],
+    input_values: List[Any]
+) -> List[int]:
+    """Evaluate all predicates on a batch of inputs.
+
+    Returns a bitmask per predicate: bit k is set iff the predicate is True
+    on input_values[k].
+    """
+    masks = []
+    n = len(input_values)
+    for pred in predicates:
+        mask = 0
+        k = 0
+        # As in _evaluate_predicates, guard the whole loop and resume after
+        # the input that raised.
+        while k < n:
+            try:
+                for k in range(k, n):
+                    if pred(input_values[k]):
+                        mask |= 1 << k
+                break
+            except Exception:
+                # If a predicate raises an exception, treat as False
+                k += 1
+        masks.append(mask)
+    return masks
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    """Yield the indices of the set bits of mask, lowest first."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def _run_generation(
+    strategy: st.SearchStrategy,
+    max_examples: int,
+    callback: Callable[[Any], None],
+) -> None:
+    """Feed up to max_examples generated inputs to callback.
+
+    Only the generate phase runs (no database, no shrinking).
+    """
+    @given(strategy)
+    @settings(
+        max_examples=max_examples,
+        database=None,
+        verbosity=Verbosity.quiet,
+        phases=[Phase.generate],
+        # Batched callbacks evaluate every predicate on a whole batch at once
+        deadline=None,
+        suppress_health_check=[HealthCheck.too_slow],
+    )
+    def run(x: Any) -> None:
+        callback(x)
+    
+    run()
 
 
 def find_disagreements(
@@ -116,21 +204,18 @@ def find_disagreements(
     else:
         pred_dict = {_get_predicate_name(p, i): p for i, p in enumerate(predicates)}
     
+    names = tuple(pred_dict)
+    preds = tuple(pred_dict.values())
+    all_true = (1 << len(preds)) - 1
     disagreements: List[PredicateResult] = []
     
-    @given(strategy)
-    @settings(
-        max_examples=max_examples,
-        database=None,
-        verbosity=Verbosity.quiet,
-        phases=[Phase.generate],
-    )
     def find_disagreement(x: Any) -> None:
-        result = _evaluate_predicates(pred_dict, x)
-        if result.has_disagreement():
-            disagreements.append(result)
+        # Only build a PredicateResult for the (usually rare) disagreements
+        mask = _evaluate_predicates(preds, x)
+        if 0 < mask < all_true:
+            disagreements.append(PredicateResult(input_value=x, mask=mask, names=names))
     
-    find_disagreement()
+    _run_generation(strategy, max_examples, find_disagreement)
     return disagreements
 
 
@@ -142,8 +227,8 @@ def disagreement_generator(
     """
     Build a Hypothesis strategy that generates inputs where predicates disagree.
     
-    This uses Hypothesis's filter mechanism to only generate values where
-    at least two predicates give different results.
+    Each drawn value is rejected with `assume` unless at least two
+    predicates give different results.
     
     Args:
         predicates: List of boolean predicates with the same signature.
@@ -164,11 +249,16 @@ def disagreement_generator(
     else:
         pred_dict = {_get_predicate_name(p, i): p for i, p in enumerate(predicates)}
     
-    def is_disagreement(x: Any) -> bool:
-        result = _evaluate_predicates(pred_dict, x)
-        return result.has_disagreement()
+    preds = tuple(pred_dict.values())
+    all_true = (1 << len(preds)) - 1
+    
+    @st.composite
+    def disagreement_inputs(draw: st.DrawFn) -> Any:
+        x = draw(strategy)
+        assume(0 < _evaluate_predicates(preds, x) < all_true)
+        return x
     
-    return strategy.filter(is_disagreement)
+    return disagreement_inputs()
 
 
 def infer_implications(
@@ -213,46 +303,78 @@ def infer_implications(
         pred_dict = {_get_predicate_name(p, i): p for i, p in enumerate(predicates)}
     
     names = list(pred_dict.keys())
+    preds = list(pred_dict.values())
+    n_preds = len(names)
     
     # Initialize: assume all implications hold until we find a counterexample
-    # potential_implications[p_i] = set of p_j where p_i => p_j might hold
-    potential_implications: Dict[str, Set[str]] = {
-        name: set(n for n in names if n != name) for name in names
-    }
+    # potential[i] = bitmask of j where names[i] => names[j] might hold
+    all_preds = (1 << n_preds) - 1
+    potential: List[int] = [all_preds ^ (1 << i) for i in range(n_preds)]
     
     counterexamples: Dict[Tuple[str, str], List[Any]] = {}
     
-    @given(strategy)
-    @settings(
-        max_examples=max_examples,
-        database=None,
-        verbosity=Verbosity.quiet,
-        phases=[Phase.generate],
-    )
-    def check_implications(x: Any) -> None:
-        result = _evaluate_predicates(pred_dict, x)
+    # Only predicates with a nonempty implication set can still refine the
+    # result. Recomputed whenever an implication is discarded.
+    sources: List[int] = list(range(n_preds))
+    
+    def refresh_sources() -> None:
+        sources[:] = [i for i, targets in enumerate(potential) if targets]
+    
+    # Inputs are buffered and evaluated in batches; p_i => p_j is broken on a
+    # batch iff masks[i] & ~masks[j] is nonzero. Masks are computed lazily, so
+    # a target is only evaluated when some source holding it is True on the
+    # batch.
+    buffer: List[Any] = []
+    
+    def flush() -> None:
+        if not buffer:
+            return
+        masks: Dict[int, int] = {}
+        
+        def mask_of(i: int) -> int:
+            if i not in masks:
+                (masks[i],) = _evaluate_predicates_batch([preds[i]], buffer)
+            return masks[i]
         
-        # For each predicate p_i that is True
-        for p_i, val_i in result.results.items():
-            if val_i:  # p_i(x) is True
-                # Check if p_j is also True for all p_j in potential_implications[p_i]
-                for p_j in list(potential_implications[p_i]):
-                    if not result.results[p_j]:  # p_j(x) is False
-                        # Counterexample found: p_i(x) but not p_j(x)
-                        potential_implications[p_i].discard(p_j)
-                        
-                        if collect_counterexamples:
-                            key = (p_i, p_j)
-                            if key not in counterexamples:
-                                counterexamples[key] = []
-                            if len(counterexamples[key]) < max_counterexamples:
-                                counterexamples[key].append(x)
-    
-    check_implications()
+        discarded = False
+        
+        for i in sources:
+            mask_i = mask_of(i)
+            if not mask_i:
+                continue
+            for j in _iter_bits(potential[i]):
+                broken = mask_i & ~mask_of(j)
+                if not broken:
+                    continue
+                # Counterexample found: p_i(x) but not p_j(x)
+                potential[i] &= ~(1 << j)
+                discarded = True
+                
+                if collect_counterexamples:
+                    examples = counterexamples.setdefault((names[i], names[j]), [])
+                    for k in _iter_bits(broken):
+                        if len(examples) >= max_counterexamples:
+                            break
+                        examples.append(buffer[k])
+        
+        buffer.clear()
+        if discarded:
+            refresh_sources()
+    
+    def check_implications(x: Any) -> None:
+        buffer.append(x)
+        if len(buffer) >= _BATCH_SIZE:
+            flush()
+    
+    _run_generation(strategy, max_examples, check_implications)
+    flush()
     
     # Build the result
     result = ImplicationResult(
-        implications=potential_implications,
+        implications={
+            names[i]: {names[j] for j in _iter_bits(potential[i])}
+            for i in range(n_preds)
+        },
         counterexamples=counterexamples if collect_counterexamples else {},
     )
     
@@ -265,27 +387,13 @@ def infer_implications(
     return result
 
 
-def find_equivalence_classes(
+def _implications_and_names(
     predicates: List[Predicate],
     strategy: st.SearchStrategy,
-    max_examples: int = 1000,
-    predicate_names: Optional[List[str]] = None,
-) -> List[Set[str]]:
-    """
-    Find equivalence classes of predicates.
-    
-    Predicates are considered equivalent if they produce the same result
-    on all tested inputs.
-    
-    Args:
-        predicates: List of boolean predicates with the same signature.
-        strategy: Hypothesis strategy to generate inputs.
-        max_examples: Maximum number of examples to test.
-        predicate_names: Optional list of names for the predicates.
-    
-    Returns:
-        List of sets, where each set contains names of equivalent predicates.
-    """
+    max_examples: int,
+    predicate_names: Optional[List[str]],
+) -> Tuple[ImplicationResult, List[str]]:
+    """Run infer_implications (without counterexamples) and resolve names."""
     if len(predicates) < 2:
         raise ValueError("At least two predicates are required")
     
@@ -302,19 +410,35 @@ def find_equivalence_classes(
         names = predicate_names
     else:
         names = [_get_predicate_name(p, i) for i, p in enumerate(predicates)]
-    
-    # Use union-find to group equivalent predicates
+    return impl_result, names
+
+
+def _equivalence_classes(
+    impl_result: ImplicationResult, names: List[str]
+) -> List[Set[str]]:
+    """Group names into classes of mutually implying predicates."""
+    # Use union-find (union by rank, iterative path compression) to group
+    # equivalent predicates
     parent: Dict[str, str] = {name: name for name in names}
-    
+    rank: Dict[str, int] = {name: 0 for name in names}
+
     def find(x: str) -> str:
-        if parent[x] != x:
-            parent[x] = find(parent[x])
-        return parent[x]
-    
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
     def union(x: str, y: str) -> None:
         px, py = find(x), find(y)
-        if px != py:
-            parent[px] = py
+        if px == py:
+            return
+        if rank[px] > rank[py]:
+            px, py = py, px
+        parent[px] = py
+        if rank[px] == rank[py]:
+            rank[py] += 1
     
     # Group predicates that are equivalent (mutual implication)
     for i, name1 in enumerate(names):
@@ -333,6 +457,56 @@ def find_equivalence_classes(
     return list(classes.values())
 
 
+def _stronger_weaker(
+    impl_result: ImplicationResult, names: List[str]
+) -> Dict[str, Dict[str, List[str]]]:
+    """Classify each pair of names as stronger/weaker (or neither)."""
+    imp = impl_result.implications
+    result: Dict[str, Dict[str, List[str]]] = {
+        name: {"stronger_than": [], "weaker_than": []} for name in names
+    }
+    
+    # Classify each unordered pair once
+    for name1, name2 in combinations(names, 2):
+        forward = name2 in imp.get(name1, ())
+        backward = name1 in imp.get(name2, ())
+        if forward and not backward:
+            result[name1]["stronger_than"].append(name2)
+            result[name2]["weaker_than"].append(name1)
+        elif backward and not forward:
+            result[name2]["stronger_than"].append(name1)
+            result[name1]["weaker_than"].append(name2)
+    
+    return result
+
+
+def find_equivalence_classes(
+    predicates: List[Predicate],
+    strategy: st.SearchStrategy,
+    max_examples: int = 1000,
+    predicate_names: Optional[List[str]] = None,
+) -> List[Set[str]]:
+    """
+    Find equivalence classes of predicates.
+    
+    Predicates are considered equivalent if they produce the same result
+    on all tested inputs.
+    
+    Args:
+        predicates: List of boolean predicates with the same signature.
+        strategy: Hypothesis strategy to generate inputs.
+        max_examples: Maximum number of examples to test.
+        predicate_names: Optional list of names for the predicates.
+    
+    Returns:
+        List of sets, where each set contains names of equivalent predicates.
+    """
+    impl_result, names = _implications_and_names(
+        predicates, strategy, max_examples, predicate_names
+    )
+    return _equivalence_classes(impl_result, names)
+
+
 def find_stronger_weaker(
     predicates: List[Predicate],
     strategy: st.SearchStrategy,
@@ -355,40 +529,38 @@ def find_stronger_weaker(
         Dictionary mapping predicate names to their stronger and weaker
         relations: {pred_name: {"stronger_than": [...], "weaker_than": [...]}}.
     """
-    if len(predicates) < 2:
-        raise ValueError("At least two predicates are required")
-    
-    impl_result = infer_implications(
-        predicates,
-        strategy,
-        max_examples=max_examples,
-        predicate_names=predicate_names,
-        collect_counterexamples=False,
+    impl_result, names = _implications_and_names(
+        predicates, strategy, max_examples, predicate_names
     )
+    return _stronger_weaker(impl_result, names)
+
+
+def find_equivalence_and_ordering(
+    predicates: List[Predicate],
+    strategy: st.SearchStrategy,
+    max_examples: int = 1000,
+    predicate_names: Optional[List[str]] = None,
+) -> Tuple[List[Set[str]], Dict[str, Dict[str, List[str]]]]:
+    """
+    Find equivalence classes and stronger/weaker relationships together.
     
-    # Build name mapping for iteration
-    if predicate_names is not None:
-        names = predicate_names
-    else:
-        names = [_get_predicate_name(p, i) for i, p in enumerate(predicates)]
-    
-    result: Dict[str, Dict[str, List[str]]] = {}
+    Equivalent to calling find_equivalence_classes and find_stronger_weaker,
+    but both results come from a single round of sampling.
     
-    for name in names:
-        stronger_than = []
-        weaker_than = []
-        
-        for other in names:
-            if other == name:
-                continue
-            if impl_result.stronger_than(name, other):
-                stronger_than.append(other)
-            elif impl_result.weaker_than(name, other):
-                weaker_than.append(other)
-        
-        result[name] = {
-            "stronger_than": stronger_than,
-            "weaker_than": weaker_than,
-        }
+    Args:
+        predicates: List of boolean predicates with the same signature.
+        strategy: Hypothesis strategy to generate inputs.
+        max_examples: Maximum number of examples to test.
+        predicate_names: Optional list of names for the predicates.
     
-    return result
+    Returns:
+        Tuple of (equivalence classes, stronger/weaker relations), in the
+        formats returned by the two functions above.
+    """
+    impl_result, names = _implications_and_names(
+        predicates, strategy, max_examples, predicate_names
+    )
+    return (
+        _equivalence_classes(impl_result, names),
+        _stronger_weaker(impl_result, names),
+    )
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+try:
+    # When running `pytest` from repo root.
+    from problems.alien_numerals.implementation import from_vesicular, to_vesicular
+except ImportError:  # pragma: no cover
+    # When running tests with cwd set to this directory.
+    from implementation import from_vesicular, to_vesicular  # type: ignore
+
+
+@pytest.mark.parametrize("n", [6**20, 10**300])
+def test_large_integer_round_trip(n: int) -> None:
+    assert from_vesicular(to_vesicular(n)) == float(n)
+
+
+def test_value_beyond_float_range_decodes_to_inf() -> None:
+    assert from_vesicular(to_vesicular(10**400)) == float("inf")
+
+
+if __name__ == "__main__":
+    import sys
+
+    raise SystemExit(pytest.main([str(Path(__file__).resolve())] + sys.argv[1:]))
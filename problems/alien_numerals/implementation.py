@@ -1,39 +1,26 @@
-import math
+from fractions import Fraction
 
 
-def to_vesicular(number, precision=6):
-    """
-    Converts a real-world number (Base-10) into Alien Vesicular Notation (Base-6).
+# Symbols
+SPORE = "•"
+VESICLE_OPEN = "("
+VESICLE_CLOSE = ")"
+SIEVE_OPEN = "C("
+SIEVE_CLOSE = ")"
 
-    Args:
-        number (float/int): The number to convert (e.g., 7.5, 49).
-        precision (int): Max depth for fractional bubbles to prevent infinite loops.
 
-    Returns:
-        str: The vesicular representation (e.g., "(•) • C(•••)").
+def _integer_shells(int_part):
+    """
+    The Integer Shells (Positive Powers): base-6 digits of a non-negative int,
+    largest bubbles first.
     """
-    if number == 0:
-        return "()"  # The Null Void (Empty Vesicle)
-
-    # 1. Split into Integer and Fractional parts
-    frac_part, int_part = math.modf(abs(number))
-    int_part = int(int_part)
-
-    # Symbols
-    SPORE = "•"
-    VESICLE_OPEN = "("
-    VESICLE_CLOSE = ")"
-    SIEVE_OPEN = "C("
-    SIEVE_CLOSE = ")"
-
     terms = []
 
-    # --- PART A: The Integer Shells (Positive Powers) ---
     # We convert the integer part to Base-6, tracking the power (depth).
-    power = 0
+    # The wrappers grow by one Vesicle per power instead of being rebuilt.
+    open_str, close_str = "", ""
     while int_part > 0:
-        digit = int_part % 6
-        int_part //= 6
+        int_part, digit = divmod(int_part, 6)
 
         if digit > 0:
             # Create the spores for this place value
@@ -43,21 +30,32 @@ def to_vesicular(number, precision=6):
             # Power 0 = Loose spores
             # Power 1 = (spores)
             # Power 2 = ((spores))
-            term = (VESICLE_OPEN * power) + spores + (VESICLE_CLOSE * power)
+            term = open_str + spores + close_str
+
+            # Digits come out smallest-first; reversed below so the largest
+            # bubbles come first (convention)
+            terms.append(term)
+
+        open_str += VESICLE_OPEN
+        close_str += VESICLE_CLOSE
 
-            # We insert at the beginning so the largest bubbles come first (convention)
-            terms.insert(0, term)
+    terms.reverse()
+    return terms
 
-        power += 1
 
-    # --- PART B: The Fractional Sieves (Negative Powers) ---
-    # We multiply by 6 repeatedly to find the fit for each depth.
+def _fractional_sieves(frac_num, frac_den, precision):
+    """
+    The Fractional Sieves (Negative Powers): base-6 digits of the proper
+    fraction frac_num / frac_den, up to `precision` levels deep.
+    """
+    terms = []
+
+    # We multiply by 6 repeatedly to find the fit for each depth. Integer
+    # arithmetic means terminating fractions stop exactly, with no drift.
     depth = 1
-    while (
-        frac_part > 1e-9 and depth <= precision
-    ):  # 1e-9 handles floating point float drift
-        frac_part *= 6
-        digit = int(frac_part)
+    open_str, close_str = SIEVE_OPEN, SIEVE_CLOSE
+    while frac_num and depth <= precision:
+        digit, frac_num = divmod(frac_num * 6, frac_den)
 
         if digit > 0:
             spores = SPORE * digit
@@ -65,13 +63,45 @@ def to_vesicular(number, precision=6):
             # Wrap in Sieves recursively
             # Depth 1 (1/6) = C(...)
             # Depth 2 (1/36) = C(C(...))
-            term = (SIEVE_OPEN * depth) + spores + (SIEVE_CLOSE * depth)
+            term = open_str + spores + close_str
             terms.append(term)
 
-        frac_part -= digit
+        open_str += SIEVE_OPEN
+        close_str += SIEVE_CLOSE
         depth += 1
 
-    # --- PART C: Assembly ---
+    return terms
+
+
+def to_vesicular(number, precision=6):
+    """
+    Converts a real-world number (Base-10) into Alien Vesicular Notation (Base-6).
+
+    Args:
+        number (float/int): The number to convert (e.g., 7.5, 49).
+        precision (int): Max depth for fractional bubbles to prevent infinite loops.
+
+    Returns:
+        str: The vesicular representation (e.g., "(•) • C(•••)").
+    """
+    if number == 0:
+        return "()"  # The Null Void (Empty Vesicle)
+
+    if isinstance(number, int):
+        # Integers have no fractional part, and stay exact however large
+        terms = _integer_shells(abs(number))
+    else:
+        # Split into Integer and Fractional parts
+        # The fractional part is kept exact as frac_num / frac_den. Snapping to
+        # the nearest fraction with a denominator up to 1e9 absorbs binary
+        # float noise (so 1/3 stays 1/3 and 0.1 stays 1/10).
+        exact = Fraction(abs(number)).limit_denominator(10**9)
+        int_part, frac_num = divmod(exact.numerator, exact.denominator)
+        terms = _integer_shells(int_part) + _fractional_sieves(
+            frac_num, exact.denominator, precision
+        )
+
+    # Assembly
     result = " ".join(terms)
 
     # Handle Negative Numbers (The Anti-Spore)
@@ -92,87 +122,106 @@ def from_vesicular(alien_str):
     - Finding a Spore '•' adds the current environment's multiplier to the total.
     """
 
-    # 1. Pre-processing:
-    # We treat 'C(' as a single unique token. Let's replace it with '{' for easy parsing.
-    # This distinguishes Sieves '{' from Vesicles '('.
-    clean_str = alien_str.replace("C(", "{")
-
-    current_multiplier = 1.0
-    # The stack remembers the multiplier of the previous layer so we can 'pop' back to it.
-    stack = [1.0]
-
-    total_value = 0.0
+    # Scan the UTF-8 bytes directly. 'C(' is recognised inline as a single
+    # Sieve token, which distinguishes Sieves from Vesicles '(' without a
+    # separate replace pass. ASCII bytes never occur inside a multi-byte
+    # sequence, so byte-level matching is safe.
+    data = alien_str.encode("utf-8")
+    n = len(data)
+
+    # Track the signed nesting depth instead of a float multiplier: a Spore
+    # at depth d is worth 6**d. `openers` records 1 for a Vesicle and 0 for a
+    # Sieve so that ')' knows which way to step back.
+    depth = 0
+    openers = bytearray()
+    # Number of Spores found at each depth
+    spores = {}
 
     i = 0
-    while i < len(clean_str):
-        char = clean_str[i]
+    while i < n:
+        byte = data[i]
 
-        if char == "(":
+        if byte == 0x28:  # "("
             # Enter Vesicle: Increase depth (Multiply by 6)
-            current_multiplier *= 6
-            stack.append(current_multiplier)
+            depth += 1
+            openers.append(1)
 
-        elif char == "{":  # This represents the original "C("
+        elif byte == 0x43 and i + 1 < n and data[i + 1] == 0x28:  # "C("
             # Enter Sieve: Decrease depth (Divide by 6)
-            current_multiplier /= 6
-            stack.append(current_multiplier)
-
-        elif char == ")":
-            # Exit Container: Pop the stack to return to previous layer's math
-            if len(stack) > 1:
-                stack.pop()
-                current_multiplier = stack[-1]
+            depth -= 1
+            openers.append(0)
+            i += 1
+
+        elif byte == 0x29:  # ")"
+            # Exit Container: return to the previous layer's depth
+            if openers:
+                depth += -1 if openers.pop() else 1
             else:
                 # Value error: More closing parens than opening ones
                 # For robustness, we just ignore extra closing tags.
                 pass
 
-        elif char == "•":
+        elif byte == 0xE2 and data[i + 1 : i + 3] == b"\x80\xa2":  # "•"
             # Found a Spore: Add its current worth to the total
-            total_value += current_multiplier
+            spores[depth] = spores.get(depth, 0) + 1
+            i += 2
 
         # Ignore spaces and other junk characters
         i += 1
 
-    # Floating point arithmetic can leave tiny artifacts (e.g. 7.00000000001).
-    # We round slightly to clean up, but return float to support fractions.
-    return round(total_value, 8)
-
-
-# --- Verification Test ---
-test_cases = [
-    "(•) • C(•••)",  # 7.5 (Logic: 6 + 1 + 3/6)
-    "((•)) (••) •",  # 49  (Logic: 36 + 12 + 1)
-    "C((•))",  # 1.0 (Logic: Cancellation! 1/6 * 6 * 1)
-    "C(•) C(•)",  # 0.333... (Logic: 1/6 + 1/6 = 2/6)
-    "((•) •)",  # 42 (Logic: 6 * (6 + 1)) -> Complex nesting test
-]
-
-print(f"{'VESICULAR STRING':<20} | {'DECODED VALUE':<10}")
-print("-" * 45)
-
-for alien in test_cases:
-    decoded = from_vesicular(alien)
-    # Print as int if it's a whole number, else float
-    display_val = int(decoded) if decoded.is_integer() else decoded
-    print(f"{alien:<20} | {display_val}")
-
-# --- Testing the System ---
-examples = [
-    4,  # Simple spores
-    6,  # 1 Vesicle
-    7.5,  # Mixed
-    49,  # Deep nesting
-    0.1666666,  # 1/6 approx
-    3.14159,  # Pi (approx)
-]
-
-print(f"{'BASE-10':<10} | {'VESICULAR NOTATION':<40}")
-print("-" * 60)
-
-for val in examples:
-    alien_num = to_vesicular(val)
-    print(f"{val:<10} | {alien_num}")
+    # Sum exactly in integers (scaled so the deepest Sieve is worth 1) and
+    # divide once, so no floating point artifacts need rounding away.
+    # We return a float to support fractions.
+    shift = max(0, -min(spores, default=0))
+    scaled = sum(count * 6 ** (d + shift) for d, count in spores.items())
+    try:
+        return scaled / 6**shift
+    except OverflowError:
+        # Deep enough nesting exceeds the float range.
+        return float("inf")
+
+
+# ==========================================
+# EXAMPLES
+# ==========================================
+
+
+def run_examples():
+    # --- Verification Test ---
+    test_cases = [
+        "(•) • C(•••)",  # 7.5 (Logic: 6 + 1 + 3/6)
+        "((•)) (••) •",  # 49  (Logic: 36 + 12 + 1)
+        "C((•))",  # 1.0 (Logic: Cancellation! 1/6 * 6 * 1)
+        "C(•) C(•)",  # 0.333... (Logic: 1/6 + 1/6 = 2/6)
+        "((•) •)",  # 42 (Logic: 6 * (6 + 1)) -> Complex nesting test
+    ]
+
+    print(f"{'VESICULAR STRING':<20} | {'DECODED VALUE':<10}")
+    print("-" * 45)
+
+    for alien in test_cases:
+        decoded = from_vesicular(alien)
+        # Print as int if it's a whole number, else float
+        display_val = int(decoded) if decoded.is_integer() else decoded
+        print(f"{alien:<20} | {display_val}")
+
+    # --- Testing the System ---
+    examples = [
+        4,  # Simple spores
+        6,  # 1 Vesicle
+        7.5,  # Mixed
+        49,  # Deep nesting
+        0.1666666,  # 1/6 approx
+        3.14159,  # Pi (approx)
+    ]
+
+    print(f"{'BASE-10':<10} | {'VESICULAR NOTATION':<40}")
+    print("-" * 60)
+
+    for val in examples:
+        alien_num = to_vesicular(val)
+        print(f"{val:<10} | {alien_num}")
+
 
 # ==========================================
 # EXPANDED TEST SUITE
@@ -255,5 +304,6 @@ def run_topology_tests():
 
 
 if __name__ == "__main__":
+    run_examples()
     run_test_suite()
     run_topology_tests()
@@ -1,9 +1,8 @@
 
 from __future__ import annotations
 
-from itertools import product
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 import hypothesis.strategies as st
 from hypothesis import given, settings
@@ -42,20 +41,37 @@ def _vars_in_cnf(cnf) -> List[int]:
 
 
 def _bruteforce_sat(cnf) -> bool:
+	# Fast path: the empty CNF is trivially satisfiable.
+	if not cnf:
+		return True
 	# Any empty clause is an immediate contradiction.
 	if any(len(clause) == 0 for clause in cnf):
 		return False
 	vars_ = _vars_in_cnf(cnf)
-	if not vars_:
-		# With no variables and no empty clause, the only satisfiable CNF is the empty CNF.
-		return len(cnf) == 0
 	if len(vars_) > 10:
 		raise ValueError(f"Too many vars for brute force: {len(vars_)}")
-	for values in product([False, True], repeat=len(vars_)):
-		model = dict(zip(vars_, values))
-		if evaluate_cnf(cnf, model):
-			return True
-	return False
+
+	# Evaluate every assignment at once: bit `a` of a truth-table int stands
+	# for the assignment where variable vars_[i] is True iff bit i of `a` is set.
+	n_rows = 1 << len(vars_)
+	all_rows = (1 << n_rows) - 1
+	columns: Dict[int, int] = {}
+	for i, v in enumerate(vars_):
+		period = 1 << (i + 1)
+		upper_half = ((1 << (1 << i)) - 1) << (1 << i)
+		columns[v] = all_rows // ((1 << period) - 1) * upper_half
+
+	satisfying = all_rows
+	for clause in cnf:
+		clause_rows = 0
+		for lit in clause:
+			col = columns[lit.var]
+			clause_rows |= (all_rows ^ col) if lit.negated else col
+		satisfying &= clause_rows
+		# Short-circuit once no assignment is left.
+		if not satisfying:
+			return False
+	return True
 
 
 @st.composite
@@ -106,9 +122,9 @@ def test_satisfiability_invariant_under_clause_and_literal_reordering(cnf) -> No
 	clauses = list(cnf)
 	clauses_reordered = tuple(reversed(clauses))
 
-	# Reorder literals within each clause (frozenset loses order, but we can
-	# rebuild clauses to ensure we're not relying on object identity).
-	rebuilt = make_cnf([list(clause) for clause in clauses_reordered])
+	# Reorder literals within each clause (clauses keep their order, so
+	# reverse them and rebuild to ensure we're not relying on object identity).
+	rebuilt = make_cnf([list(reversed(clause)) for clause in clauses_reordered])
 
 	assert is_satisfiable(cnf) == is_satisfiable(rebuilt)
 
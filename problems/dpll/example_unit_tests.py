@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from itertools import product
 from pathlib import Path
 from typing import Dict, Iterable, Mapping
 
@@ -44,18 +43,31 @@ def _vars_in_cnf(cnf) -> set[int]:
 def _bruteforce_sat(cnf) -> bool:
     """Brute-force SAT oracle for small formulas."""
     vars_ = sorted(_vars_in_cnf(cnf))
-    if not vars_:
-        return True
 
     # Keep this only for truly small problems.
     if len(vars_) > 12:
         raise ValueError(f"Too many vars for brute force: {len(vars_)}")
 
-    for values in product([False, True], repeat=len(vars_)):
-        model = dict(zip(vars_, values))
-        if evaluate_cnf(cnf, model):
-            return True
-    return False
+    # Evaluate every assignment at once: bit `a` of a truth-table int stands
+    # for the assignment where vars_[i] is True iff bit i of `a` is set.
+    n_rows = 1 << len(vars_)
+    all_rows = (1 << n_rows) - 1
+    columns: Dict[int, int] = {}
+    for i, v in enumerate(vars_):
+        period = 1 << (i + 1)
+        upper_half = ((1 << (1 << i)) - 1) << (1 << i)
+        columns[v] = all_rows // ((1 << period) - 1) * upper_half
+
+    satisfying = all_rows
+    for clause in cnf:
+        clause_rows = 0
+        for lit in clause:
+            col = columns[lit.var]
+            clause_rows |= (all_rows ^ col) if lit.negated else col
+        satisfying &= clause_rows
+        if not satisfying:
+            return False
+    return True
 
 
 def test_parse_literal_negative_zero_is_distinct() -> None:
@@ -69,6 +81,14 @@ def test_parse_literal_negative_zero_is_distinct() -> None:
     assert str(pos0) == "0"
 
 
+@pytest.mark.parametrize("var", [True, 1.0, 2.0, "1"])
+def test_literal_rejects_non_int_vars(var) -> None:
+    Literal(1)
+    with pytest.raises(TypeError):
+        Literal(var)
+    assert str(Literal(1)) == "1"
+
+
 def test_empty_formula_is_satisfiable() -> None:
     cnf = make_cnf([])
     model = dpll(cnf)
@@ -82,14 +102,17 @@ def test_formula_with_empty_clause_is_unsat() -> None:
     assert is_satisfiable(cnf) is False
 
 
-def test_small_instances_match_bruteforce_oracle() -> None:
+@pytest.mark.parametrize("use_pysat", [False, True], ids=["dpll", "pysat"])
+def test_small_instances_match_bruteforce_oracle(use_pysat: bool) -> None:
+    if use_pysat:
+        pytest.importorskip("pysat")
     instances_path = HERE / "small_instances.txt"
     instances = load_instances(instances_path)
     assert instances, "Expected at least one CNF instance in small_instances.txt"
 
     for idx, cnf in enumerate(instances, 1):
         expected = _bruteforce_sat(cnf)
-        got_model = dpll(cnf)
+        got_model = dpll(cnf, use_pysat=use_pysat)
         got_sat = got_model is not None
 
         assert got_sat == expected, f"Mismatch on instance #{idx}"
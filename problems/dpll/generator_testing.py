@@ -1,6 +1,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
@@ -15,13 +16,27 @@ except ImportError:  # pragma: no cover
 	from implementation import Literal, dpll, evaluate_cnf, make_cnf  # type: ignore
 
 
+# Set PBT_VERBOSE=1 to print every generated CNF and model.
+VERBOSE = bool(os.environ.get("PBT_VERBOSE"))
+
+
+def _small_size(draw, min_value: int, max_value: int) -> int:
+	"""Draw a size in [min_value, max_value], biased toward small values.
+
+	The smaller of two uniform draws: small formulas come up more often, so
+	failures start (and shrink) from smaller examples.
+	"""
+	sizes = st.integers(min_value=min_value, max_value=max_value)
+	return min(draw(sizes), draw(sizes))
+
+
 def _fmt_cnf(cnf) -> str:
 	return "[" + ", ".join("{" + ", ".join(sorted(str(l) for l in clause)) + "}" for clause in cnf) + "]"
 
 
 @dataclass(frozen=True)
 class SatInstance:
-	cnf: tuple[frozenset[Literal], ...]
+	cnf: tuple[tuple[Literal, ...], ...]
 	witness: Dict[int, bool]
 
 
@@ -32,13 +47,13 @@ def satisfiable_cnf(draw) -> SatInstance:
 	We first generate a random witness assignment, then generate each clause so
 	that at least one literal is True under the witness.
 	"""
-	n_vars = draw(st.integers(min_value=1, max_value=8))
+	n_vars = _small_size(draw, 1, 8)
 	vars_ = list(range(n_vars))
 
 	# Witness assignment (include var 0 frequently).
 	witness = {v: draw(st.booleans()) for v in vars_}
 
-	n_clauses = draw(st.integers(min_value=1, max_value=12))
+	n_clauses = _small_size(draw, 1, 12)
 	clauses: List[List[Literal]] = []
 
 	for _ in range(n_clauses):
@@ -71,14 +86,14 @@ def unsatisfiable_cnf(draw):
 	Core unsat kernel: (x) AND (¬x).
 	Optionally add extra clauses (which cannot restore satisfiability).
 	"""
-	n_vars = draw(st.integers(min_value=1, max_value=8))
+	n_vars = _small_size(draw, 1, 8)
 	vars_ = list(range(n_vars))
 
 	v = draw(st.sampled_from(vars_))
 	clauses: List[List[Literal]] = [[Literal(v, False)], [Literal(v, True)]]
 
 	# Add some extra random clauses.
-	extra = draw(st.integers(min_value=0, max_value=8))
+	extra = _small_size(draw, 0, 8)
 	for _ in range(extra):
 		k = draw(st.integers(min_value=1, max_value=min(4, len(vars_))))
 		chosen_vars = draw(
@@ -99,11 +114,13 @@ def unsatisfiable_cnf(draw):
 @settings(max_examples=50, deadline=None, print_blob=True)
 def pbt_inputs_that_pass(inst: SatInstance) -> None:
 	"""Generate SAT inputs; DPLL should return a satisfying model."""
-	print("\nSAT CNF:", _fmt_cnf(inst.cnf))
-	print("Witness (constructor):", inst.witness)
+	if VERBOSE:
+		print("\nSAT CNF:", _fmt_cnf(inst.cnf))
+		print("Witness (constructor):", inst.witness)
 
 	model = dpll(inst.cnf)
-	print("DPLL model:", model)
+	if VERBOSE:
+		print("DPLL model:", model)
 
 	assert model is not None
 	assert evaluate_cnf(inst.cnf, model)
@@ -113,17 +130,19 @@ def pbt_inputs_that_pass(inst: SatInstance) -> None:
 @settings(max_examples=50, deadline=None, print_blob=True)
 def pbt_inputs_that_fail(cnf) -> None:
 	"""Generate UNSAT inputs; DPLL should return None."""
-	print("\nUNSAT CNF:", _fmt_cnf(cnf))
+	if VERBOSE:
+		print("\nUNSAT CNF:", _fmt_cnf(cnf))
 
 	model = dpll(cnf)
-	print("DPLL model:", model)
+	if VERBOSE:
+		print("DPLL model:", model)
 
 	assert model is None
 
 
 if __name__ == "__main__":
 	# Running this file directly will execute both property tests.
-	# Note: these print a lot by design.
+	# Note: with PBT_VERBOSE=1 these print every example.
 	print("Running SAT generator PBT (expected to PASS)...")
 	pbt_inputs_that_pass()
 	print("\nRunning UNSAT generator PBT (expected to FAIL satisfiable, i.e. return None)...")
@@ -1,7 +1,7 @@
 """Property-based tests for Roman numeral conversion functions using Hypothesis."""
 
 import pytest
-from hypothesis import given, assume, strategies as st
+from hypothesis import given, strategies as st
 from implementation import to_numerals, from_numerals
 
 
@@ -10,9 +10,19 @@ valid_integers = st.integers(min_value=1, max_value=3999)
 invalid_low_integers = st.integers(max_value=0)
 invalid_high_integers = st.integers(min_value=4000)
 roman_characters = st.sampled_from(['I', 'V', 'X', 'L', 'C', 'D', 'M'])
-invalid_characters = st.characters(blacklist_categories=('Cs',)).filter(
-    lambda c: c not in 'IVXLCDM'
+invalid_characters = st.characters(
+    blacklist_categories=('Cs',), blacklist_characters='IVXLCDM'
 )
+# Two different valid integers, in either order
+distinct_integer_pairs = st.lists(valid_integers, min_size=2, max_size=2, unique=True)
+
+
+@st.composite
+def widely_separated_pairs(draw):
+    """Valid integers n1 < n2 with n2 - n1 >= 1000, drawn without rejection."""
+    n1 = draw(st.integers(min_value=1, max_value=2999))
+    n2 = draw(st.integers(min_value=n1 + 1000, max_value=3999))
+    return n1, n2
 
 
 class TestToNumeralsProperties:
@@ -45,11 +55,10 @@ class TestToNumeralsProperties:
         roman = to_numerals(n)
         assert from_numerals(roman) == n
     
-    @given(valid_integers, valid_integers)
-    def test_monotonic_length_for_larger_values(self, n1, n2):
+    @given(widely_separated_pairs())
+    def test_monotonic_length_for_larger_values(self, pair):
         """Property: Larger numbers generally don't produce shorter strings."""
-        assume(n1 < n2)
-        assume(n2 - n1 >= 1000)  # Significant difference
+        n1, n2 = pair
         len1 = len(to_numerals(n1))
         len2 = len(to_numerals(n2))
         assert len2 >= len1, f"Length decreased from {len1} to {len2} for {n1} -> {n2}"
@@ -94,7 +103,7 @@ class TestToNumeralsProperties:
     @given(st.one_of(st.floats(), st.text(), st.none(), st.lists(st.integers())))
     def test_rejects_non_integer_types(self, value):
         """Property: Non-integer inputs raise TypeError."""
-        assume(not isinstance(value, bool))  # bool is subclass of int
+        # None of these strategies yield bool (a subclass of int)
         with pytest.raises(TypeError):
             to_numerals(value)
     
@@ -182,10 +191,10 @@ class TestFromNumeralsProperties:
 class TestRelationalProperties:
     """Property-based tests for relationships between the functions."""
     
-    @given(valid_integers, valid_integers)
-    def test_order_preservation(self, n1, n2):
+    @given(distinct_integer_pairs)
+    def test_order_preservation(self, pair):
         """Property: If n1 < n2, then from_numerals(to_numerals(n1)) < from_numerals(to_numerals(n2))."""
-        assume(n1 != n2)
+        n1, n2 = pair
         result1 = from_numerals(to_numerals(n1))
         result2 = from_numerals(to_numerals(n2))
         
@@ -212,11 +221,10 @@ class TestRelationalProperties:
 class TestMetamorphicProperties:
     """Metamorphic property-based tests."""
     
-    @given(valid_integers)
+    @given(st.integers(min_value=1, max_value=3))  # Simple cases where concatenation works
     def test_concatenation_reflects_addition_for_some_cases(self, n):
         """Property: For certain values, concatenating Roman numerals is like addition."""
         # This is true for additive cases, e.g., to_numerals(2) = "II"
-        assume(1 <= n <= 3)  # Simple cases where concatenation works
         roman_n = to_numerals(n)
         roman_2n = to_numerals(2 * n)
         
@@ -228,11 +236,9 @@ class TestMetamorphicProperties:
         elif n == 3:
             assert from_numerals(roman_n + roman_n) == 6, f"Failed for n={n}"
     
-    @given(valid_integers)
+    @given(st.integers(min_value=1000, max_value=3999))  # Focus on larger numbers
     def test_string_length_grows_with_magnitude(self, n):
         """Property: Generally, larger numbers have longer or equal string representations."""
-        assume(n >= 1000)  # Focus on larger numbers
-        
         # Divide by 2 and compare lengths
         half_n = n // 2
         if half_n >= 1:
@@ -4,6 +4,10 @@ import pytest
 from implementation import to_numerals, from_numerals
 
 
+ROUND_TRIP_VALUES = (1, 4, 5, 9, 10, 40, 50, 90, 100, 400, 500, 900, 1000,
+                     1994, 2023, 3999)
+
+
 class TestToNumerals:
     """Test cases for integer to Roman numeral conversion."""
     
@@ -70,6 +74,8 @@ class TestToNumerals:
             to_numerals(3.14)
         with pytest.raises(TypeError):
             to_numerals(None)
+        with pytest.raises(TypeError):
+            to_numerals(True)
 
 
 class TestFromNumerals:
@@ -141,13 +147,11 @@ class TestFromNumerals:
 class TestRoundTrip:
     """Test round-trip conversion properties."""
     
-    def test_round_trip_all_valid_range(self):
+    @pytest.mark.parametrize("n", ROUND_TRIP_VALUES)
+    def test_round_trip_all_valid_range(self, n):
         """Test that to_numerals(from_numerals(x)) == x for sample values."""
-        test_values = [1, 4, 5, 9, 10, 40, 50, 90, 100, 400, 500, 900, 1000,
-                       1994, 2023, 3999]
-        for n in test_values:
-            roman = to_numerals(n)
-            assert from_numerals(roman) == n
+        roman = to_numerals(n)
+        assert from_numerals(roman) == n
     
     def test_round_trip_canonical_form(self):
         """Test that canonical Roman numerals convert correctly."""
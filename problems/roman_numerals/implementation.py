@@ -4,6 +4,34 @@ This module provides conversion between positive integers (1-3999)
 and their canonical Roman numeral string representations.
 """
 
+# Greedy decomposition in descending order
+_VALUE_MAP = (
+    (1000, 'M'),
+    (900, 'CM'),
+    (500, 'D'),
+    (400, 'CD'),
+    (100, 'C'),
+    (90, 'XC'),
+    (50, 'L'),
+    (40, 'XL'),
+    (10, 'X'),
+    (9, 'IX'),
+    (5, 'V'),
+    (4, 'IV'),
+    (1, 'I'),
+)
+
+# Symbol values
+_SYMBOL_VALUES = {
+    'I': 1,
+    'V': 5,
+    'X': 10,
+    'L': 50,
+    'C': 100,
+    'D': 500,
+    'M': 1000,
+}
+
 def to_numerals(N: int) -> str:
     """Convert an integer to its canonical Roman numeral representation.
     
@@ -14,7 +42,7 @@ def to_numerals(N: int) -> str:
         A canonical Roman numeral string representing N
         
     Raises:
-        TypeError: If N is not an integer
+        TypeError: If N is not an integer (bools are rejected too)
         ValueError: If N is outside the range [1, 3999]
         
     Example:
@@ -23,39 +51,35 @@ def to_numerals(N: int) -> str:
         >>> to_numerals(1994)
         'MCMXCIV'
     """
-    if not isinstance(N, int):
+    if not isinstance(N, int) or isinstance(N, bool):
         raise TypeError(f"Input must be an integer, got {type(N).__name__}")
     
     if N < 1 or N > 3999:
         raise ValueError(f"Input must be in range [1, 3999], got {N}")
     
-    # Greedy decomposition in descending order
-    value_map = [
-        (1000, 'M'),
-        (900, 'CM'),
-        (500, 'D'),
-        (400, 'CD'),
-        (100, 'C'),
-        (90, 'XC'),
-        (50, 'L'),
-        (40, 'XL'),
-        (10, 'X'),
-        (9, 'IX'),
-        (5, 'V'),
-        (4, 'IV'),
-        (1, 'I'),
-    ]
-    
+    return _TABLE[N]
+
+
+def _encode(N: int) -> str:
+    """Greedy Roman numeral encoding of N (no validation)."""
     result = []
     remaining = N
     
-    for value, token in value_map:
+    for value, token in _VALUE_MAP:
         while remaining >= value:
             result.append(token)
             remaining -= value
     
     return ''.join(result)
 
+
+# The domain is only 1..3999, so every canonical numeral is encoded once at
+# import and to_numerals is a lookup (index 0 is unused).
+_TABLE = ('',) + tuple(_encode(i) for i in range(1, 4000))
+
+# Canonical numerals parse by lookup; anything else goes through the scan
+_REVERSE = {numeral: i for i, numeral in enumerate(_TABLE) if i}
+
 def from_numerals(roman: str) -> int:
     """Convert a Roman numeral string to its integer value.
     
@@ -81,35 +105,27 @@ def from_numerals(roman: str) -> int:
     if not roman:
         raise ValueError("Input cannot be an empty string")
     
-    # Symbol values
-    symbol_values = {
-        'I': 1,
-        'V': 5,
-        'X': 10,
-        'L': 50,
-        'C': 100,
-        'D': 500,
-        'M': 1000,
-    }
-    
-    # Validate all characters are valid Roman numeral symbols
-    for char in roman:
-        if char not in symbol_values:
-            raise ValueError(f"Invalid Roman numeral character: '{char}'")
+    value = _REVERSE.get(roman)
+    if value is not None:
+        return value
     
     total = 0
     prev_value = 0
     
-    # Process from right to left
-    for char in reversed(roman):
-        value = symbol_values[char]
-        
-        # If current value is less than previous, subtract (subtractive notation)
-        if value < prev_value:
-            total -= value
-        else:
-            total += value
-        
-        prev_value = value
+    # Process from right to left; the dict lookups run in C via map, and an
+    # unknown symbol surfaces as a KeyError instead of a separate validation pass.
+    try:
+        for value in map(_SYMBOL_VALUES.__getitem__, reversed(roman)):
+            # If current value is less than previous, subtract (subtractive notation)
+            if value < prev_value:
+                total -= value
+            else:
+                total += value
+            
+            prev_value = value
+    except KeyError:
+        # Report the first invalid character from the left
+        char = next(c for c in roman if c not in _SYMBOL_VALUES)
+        raise ValueError(f"Invalid Roman numeral character: '{char}'") from None
     
-    return total
\ No newline at end of file
+    return total
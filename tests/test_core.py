@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import time
+
+from hypothesis import strategies as st
+
+from hypothesis_pick import infer_implications
+
+
+def test_slow_predicates_do_not_hit_the_deadline() -> None:
+    # A whole batch of inputs is evaluated inside one Hypothesis example, so a
+    # 1 ms predicate would blow the default 200 ms deadline.
+    def slow_positive(x: int) -> bool:
+        time.sleep(0.001)
+        return x > 0
+
+    result = infer_implications(
+        [slow_positive, lambda x: x > 1],
+        st.integers(),
+        max_examples=1000,
+        predicate_names=["positive", "above_one"],
+    )
+
+    assert result.implies("above_one", "positive")